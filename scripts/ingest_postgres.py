@@ -1,3 +1,5 @@
+import logging
+import os
 import sys
 from pathlib import Path
 
@@ -6,11 +8,28 @@ sys.path.append(str(Path(__file__).parent.parent))
 from src.utils.config import load_config
 from src.pipeline.postgres_ingestion import PostgresIngestionPipeline
 
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging() -> None:
+    # LOG_LEVEL applies to this project's loggers only. Root stays at WARNING
+    # so httpx/botocore don't log a line per embedding request.
+    logging.basicConfig(format="%(message)s")
+    level_name = os.getenv('LOG_LEVEL', 'INFO').upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        logger.warning("  ⚠ Invalid LOG_LEVEL %r — using INFO", level_name)
+        level = logging.INFO
+    for name in ('src', __name__):
+        logging.getLogger(name).setLevel(level)
+
 
 def main():
-    print("\nLoading configuration...")
+    _configure_logging()
+
+    logger.info("\nLoading configuration...")
     config = load_config('config/config.yaml')
-    print("✓ Configuration loaded")
+    logger.info("✓ Configuration loaded")
 
     pipeline = PostgresIngestionPipeline(config)
     pipeline.run()
@@ -1,8 +1,17 @@
+import asyncio
+import hashlib
 import json
+import logging
 import os
 import time
 import random
-from typing import List
+import threading
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# 10 req/s steady state across all threads — stays under Bedrock quota
+BEDROCK_MIN_INTERVAL = 0.1
 
 
 class Embedder:
@@ -18,6 +27,9 @@ class Embedder:
         self.model = model
         self.base_url = base_url
         self._bedrock_client = None
+        self._cache: Dict[bytes, List[float]] = {}
+        self._bedrock_rate_lock = threading.Lock()
+        self._bedrock_next_slot = 0.0
 
         if provider != "bedrock":
             self._lc_embeddings = self._init_lc_embeddings()
@@ -37,6 +49,16 @@ class Embedder:
             )
         return self._bedrock_client
 
+    def _wait_for_bedrock_slot(self) -> None:
+        # Shared by every executor thread, so total Bedrock traffic stays at
+        # 10 req/s however many batches embeddings.concurrency puts in flight.
+        with self._bedrock_rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._bedrock_next_slot)
+            self._bedrock_next_slot = slot + BEDROCK_MIN_INTERVAL
+        if slot > now:
+            time.sleep(slot - now)
+
     def _embed_one_bedrock(self, text: str) -> List[float]:
         # We call boto3 directly instead of using langchain_aws.BedrockEmbeddings
         # because langchain_aws has its own internal retry loop (4 attempts with
@@ -46,6 +68,7 @@ class Embedder:
         # Using boto3 directly gives us a single, predictable retry loop.
         client = self._get_bedrock_client()
         for attempt in range(8):
+            self._wait_for_bedrock_slot()
             try:
                 response = client.invoke_model(
                     modelId=self.model,
@@ -56,7 +79,7 @@ class Embedder:
                 return json.loads(response['body'].read())['embedding']
             except client.exceptions.ThrottlingException:
                 wait = min(2 ** attempt + random.uniform(0, 1), 60)
-                print(f"  Bedrock throttled — retrying in {wait:.1f}s (attempt {attempt + 1})")
+                logger.warning("  Bedrock throttled — retrying in %.1fs (attempt %d)", wait, attempt + 1)
                 time.sleep(wait)
             except Exception:
                 raise
@@ -67,11 +90,44 @@ class Embedder:
             return self._embed_one_bedrock(text)
         return self._lc_embeddings.embed_query(text)
 
-    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+    def _embed_documents_uncached(self, texts: List[str]) -> List[List[float]]:
         if self.provider == "bedrock":
-            results = []
-            for text in texts:
-                results.append(self._embed_one_bedrock(text))
-                time.sleep(0.1)  # 10 req/s steady state — stays under Bedrock quota
-            return results
+            return [self._embed_one_bedrock(text) for text in texts]
         return self._lc_embeddings.embed_documents(texts)
+
+    async def _aembed_documents_uncached(self, texts: List[str]) -> List[List[float]]:
+        if self.provider == "bedrock":
+            # boto3 has no async client — run the rate-limited, retrying loop on
+            # the default executor so several batches can be in flight at once.
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._embed_documents_uncached, texts)
+        return await self._lc_embeddings.aembed_documents(texts)
+
+    # Multi-location services fan out into rows that often share identical
+    # embedding_text. Duplicates within a call and texts cached by an earlier
+    # call are not re-embedded; overlapping aembed_documents calls can both
+    # embed a text neither has cached yet, so callers that run batches
+    # concurrently should dedupe first (see PostgresIngestionPipeline.arun).
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _missing(self, keys: List[bytes], texts: List[str]) -> Dict[bytes, str]:
+        # dict preserves first-seen order and drops duplicates within the call
+        return {key: text for key, text in zip(keys, texts) if key not in self._cache}
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._cache_key(text) for text in texts]
+        missing = self._missing(keys, texts)
+        if missing:
+            vectors = self._embed_documents_uncached(list(missing.values()))
+            self._cache.update(zip(missing.keys(), vectors))
+        return [self._cache[key] for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self._cache_key(text) for text in texts]
+        missing = self._missing(keys, texts)
+        if missing:
+            vectors = await self._aembed_documents_uncached(list(missing.values()))
+            self._cache.update(zip(missing.keys(), vectors))
+        return [self._cache[key] for key in keys]
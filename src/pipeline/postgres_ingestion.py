@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 from datetime import datetime, timezone
 from typing import Dict, List
@@ -6,6 +8,8 @@ from ..loaders.postgres_loader import PostgresLoader
 from ..embeddings.embedder import Embedder
 from ..storage.postgres_store import PostgresStore
 
+logger = logging.getLogger(__name__)
+
 
 class PostgresIngestionPipeline:
     """Pipeline for embedding service snapshots and writing them to Postgres"""
@@ -13,8 +17,9 @@ class PostgresIngestionPipeline:
     def __init__(self, config: dict):
         self.config = config
         pg = config['postgres']
+        self.concurrency = self._validate_concurrency(config['embeddings'].get('concurrency', 1))
 
-        print("Initializing Postgres ingestion pipeline...")
+        logger.info("Initializing Postgres ingestion pipeline...")
 
         self.loader = PostgresLoader(sql_file=pg['sql_file'])
 
@@ -27,7 +32,7 @@ class PostgresIngestionPipeline:
         self.store = PostgresStore(table_name=pg['table_name'])
         self.batch_size = pg['batch_size']
 
-        print("✓ Pipeline initialized")
+        logger.info("✓ Pipeline initialized")
 
     # ------------------------------------------------------------------
     # SSM helpers — gracefully degrade when running outside ECS/AWS
@@ -43,7 +48,7 @@ class PostgresIngestionPipeline:
             response = ssm.get_parameter(Name=ssm_param)
             return response['Parameter']['Value']
         except Exception as e:
-            print(f"  ⚠ Could not read SSM param ({e}) — defaulting to full run")
+            logger.warning("  ⚠ Could not read SSM param (%s) — defaulting to full run", e)
             return "never"
 
     def _write_last_run_at(self, timestamp: str) -> None:
@@ -54,38 +59,98 @@ class PostgresIngestionPipeline:
             import boto3
             ssm = boto3.client('ssm', region_name=os.getenv('AWS_REGION', 'us-east-1'))
             ssm.put_parameter(Name=ssm_param, Value=timestamp, Type='String', Overwrite=True)
-            print(f"  ✓ SSM last_run_at updated → {timestamp}")
+            logger.info("  ✓ SSM last_run_at updated → %s", timestamp)
         except Exception as e:
-            print(f"  ⚠ Could not write SSM param: {e}")
+            logger.warning("  ⚠ Could not write SSM param: %s", e)
+
+    # ------------------------------------------------------------------
+    # Embedding
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _validate_concurrency(value) -> int:
+        # Semaphore(0) would never be acquired and the run would hang
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(
+                f"embeddings.concurrency must be an integer >= 1, got {value!r}"
+            )
+        return value
+
+    @staticmethod
+    def _check_dimension(vectors: List[List[float]], expected_dim) -> None:
+        if expected_dim is None:
+            return
+        actual_dim = len(vectors[0])
+        if actual_dim != expected_dim:
+            raise ValueError(
+                f"Embedding dimension mismatch: model produced {actual_dim}d vectors "
+                f"but config expects {expected_dim}d. "
+                f"Update embedding_dimension in config.yaml AND re-run the DDL migration."
+            )
+
+    async def _embed_batches(self, batches: List[List[str]], expected_dim) -> List[List[float]]:
+        """
+        Embed all batches of texts with up to `concurrency` requests in flight.
+
+        The first batch is embedded on its own so a dimension mismatch fails before
+        the rest are dispatched. gather() returns results in submission order, so
+        the flattened vectors line up with the texts.
+        """
+        total_batches = len(batches)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def embed_batch(i: int, texts: List[str]) -> List[List[float]]:
+            async with semaphore:
+                vectors = await self.embedder.aembed_documents(texts)
+            logger.info("  Batch %d/%d — %d texts embedded", i, total_batches, len(texts))
+            return vectors
+
+        first = await embed_batch(1, batches[0])
+        self._check_dimension(first, expected_dim)
+
+        rest = await asyncio.gather(
+            *(embed_batch(i, batch) for i, batch in enumerate(batches[1:], start=2))
+        )
+        return [vector for vectors in (first, *rest) for vector in vectors]
 
     # ------------------------------------------------------------------
     # Main run
     # ------------------------------------------------------------------
 
     def run(self) -> Dict:
-        print(f"\n{'='*60}")
-        print("POSTGRES INGESTION PIPELINE")
-        print(f"{'='*60}")
+        """Run the pipeline to completion (wraps arun in a fresh event loop)"""
+        return asyncio.run(self.arun())
+
+    async def arun(self) -> Dict:
+        """
+        Run the pipeline inside an existing event loop.
+
+        Only embedding is concurrent. The load and write steps are synchronous
+        psycopg calls and block the loop while they run.
+        """
+        logger.info("\n%s", "=" * 60)
+        logger.info("POSTGRES INGESTION PIPELINE")
+        logger.info("=" * 60)
 
         last_run_at = self._read_last_run_at()
         is_full_run = (last_run_at == "never")
         run_mode = "FULL" if is_full_run else f"INCREMENTAL (since {last_run_at})"
-        print(f"\nMode: {run_mode}")
+        logger.info("\nMode: %s", run_mode)
 
         # Step 1: Load
-        print("\n[1/3] Loading rows from database...")
+        logger.info("\n[1/3] Loading rows from database...")
         rows = self.loader.load(last_run_at=last_run_at)
         total = len(rows)
-        print(f"  ✓ Loaded {total} rows")
+        logger.info("  ✓ Loaded %d rows", total)
 
         deleted_service_ids: List[int] = []
         if not is_full_run:
             deleted_service_ids = self.loader.load_deleted_ids(last_run_at=last_run_at)
             if deleted_service_ids:
-                print(f"  ✓ {len(deleted_service_ids)} soft-deleted service(s) to remove")
+                logger.info("  ✓ %d soft-deleted service(s) to remove", len(deleted_service_ids))
 
         if not rows and not deleted_service_ids:
-            print("  — No changes since last run, nothing to do")
+            logger.info("  — No changes since last run, nothing to do")
             return {
                 'total_rows': 0,
                 'total_batches': 0,
@@ -94,50 +159,44 @@ class PostgresIngestionPipeline:
             }
 
         # Step 2: Embed
-        batches = [rows[i:i + self.batch_size] for i in range(0, total, self.batch_size)]
+        # Multi-location services share embedding_text. Dedupe across all rows
+        # up front: concurrent batches can't rely on the embedder cache, since
+        # two in-flight batches may both miss on the same text.
+        texts = list(dict.fromkeys(row['embedding_text'] for row in rows))
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
         total_batches = len(batches)
         all_vectors: List[List[float]] = []
 
         if rows:
             expected_dim = self.config['embeddings'].get('embedding_dimension')
-            print(f"\n[2/3] Embedding {total} rows in {total_batches} batches of {self.batch_size}...")
-
-            for i, batch in enumerate(batches, start=1):
-                texts = [row['embedding_text'] for row in batch]
-                vectors = self.embedder.embed_documents(texts)
-
-                if i == 1 and expected_dim is not None:
-                    actual_dim = len(vectors[0])
-                    if actual_dim != expected_dim:
-                        raise ValueError(
-                            f"Embedding dimension mismatch: model produced {actual_dim}d vectors "
-                            f"but config expects {expected_dim}d. "
-                            f"Update embedding_dimension in config.yaml AND re-run the DDL migration."
-                        )
-
-                all_vectors.extend(vectors)
-                print(f"  Batch {i}/{total_batches} — {len(batch)} rows embedded")
+            logger.info(
+                "\n[2/3] Embedding %d rows (%d distinct texts) in %d batches of %d (%d in flight)...",
+                total, len(texts), total_batches, self.batch_size, self.concurrency,
+            )
+            vectors = await self._embed_batches(batches, expected_dim)
+            by_text = dict(zip(texts, vectors))
+            all_vectors = [by_text[row['embedding_text']] for row in rows]
         else:
-            print("\n[2/3] No active rows to embed — skipping embedding step")
+            logger.info("\n[2/3] No active rows to embed — skipping embedding step")
 
         # Step 3: Write
-        print(f"\n[3/3] Writing to {self.config['postgres']['table_name']}...")
+        logger.info("\n[3/3] Writing to %s...", self.config['postgres']['table_name'])
         if is_full_run:
             self.store.write_all(rows, all_vectors, self.batch_size)
         else:
             self.store.write_incremental(rows, all_vectors, self.batch_size, deleted_service_ids)
-        print(f"  ✓ {total} rows written")
+        logger.info("  ✓ %d rows written", total)
 
         # Update SSM timestamp
         self._write_last_run_at(datetime.now(timezone.utc).isoformat())
 
-        print(f"\n{'='*60}")
-        print("✓ Ingestion complete")
-        print(f"  Mode:    {run_mode}")
-        print(f"  Rows:    {total}")
-        print(f"  Batches: {total_batches}")
-        print(f"  Table:   {self.config['postgres']['table_name']}")
-        print(f"{'='*60}\n")
+        logger.info("\n%s", "=" * 60)
+        logger.info("✓ Ingestion complete")
+        logger.info("  Mode:    %s", run_mode)
+        logger.info("  Rows:    %d", total)
+        logger.info("  Batches: %d", total_batches)
+        logger.info("  Table:   %s", self.config['postgres']['table_name'])
+        logger.info("%s\n", "=" * 60)
 
         return {
             'total_rows': total,
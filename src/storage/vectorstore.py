@@ -1,4 +1,8 @@
 
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 import chromadb
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
@@ -35,18 +39,48 @@ class VectorStore:
             embedding_function=self.embeddings,
         )
     
-    def add_documents(self, documents: List[Document]) -> List[str]:
+    def add_documents(
+        self,
+        documents: List[Document],
+        batch_size: int = 256,
+        max_workers: int = 4
+    ) -> List[str]:
         """
-        Add documents to vector store
-        
+        Add documents to vector store in fixed-size batches
+
+        Each batch is one embedding request plus one Chroma write; batches
+        are submitted to a thread pool so embedding calls overlap. Batches
+        commit independently, so if any batch fails the ones already written
+        are deleted before the error is re-raised — a partly ingested
+        document never looks complete to contains().
+
         Args:
             documents: List of LangChain Document objects
                       Each should have page_content and metadata
-        
+            batch_size: Documents per embedding/insert call
+            max_workers: Batches in flight at once
+
         Returns:
-            List of document IDs
+            List of document IDs, in the same order as documents
         """
-        ids = self.store.add_documents(documents)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(self.store.add_documents, documents[i:i + batch_size])
+                for i in range(0, len(documents), batch_size)
+            ]
+
+        # Leaving the with-block waits for every batch
+        ids, error = [], None
+        for future in futures:
+            if future.exception() is None:
+                ids.extend(future.result())
+            elif error is None:
+                error = future.exception()
+
+        if error is not None:
+            if ids:
+                self.store.delete(ids=ids)
+            raise error
         return ids
     
     def similarity_search(
@@ -71,7 +105,76 @@ class VectorStore:
             k=k,
             filter=filter
         )
-    
+
+    async def aadd_documents(
+        self,
+        documents: List[Document],
+        batch_size: int = 256,
+        max_workers: int = 4
+    ) -> List[str]:
+        """
+        Async variant of add_documents
+
+        Runs the batched add_documents on the default executor, so the same
+        batching and failure cleanup apply.
+
+        Args:
+            documents: List of LangChain Document objects
+            batch_size: Documents per embedding/insert call
+            max_workers: Batches in flight at once
+
+        Returns:
+            List of document IDs, in the same order as documents
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.add_documents, documents, batch_size, max_workers)
+        )
+
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 5,
+        filter: Optional[Dict] = None
+    ) -> List[Document]:
+        """
+        Async variant of similarity_search
+
+        langchain_chroma has no native async search; the base class runs the
+        sync search on the default executor. Concurrent queries still overlap
+        instead of blocking the event loop.
+
+        Args:
+            query: Search query text
+            k: Number of results to return
+            filter: Metadata filters (e.g., {"city": "San Francisco"})
+
+        Returns:
+            List of matching Document objects
+        """
+        return await self.store.asimilarity_search(
+            query=query,
+            k=k,
+            filter=filter
+        )
+
+    def contains(self, filter: Dict) -> bool:
+        """
+        Check whether any stored document matches a metadata filter
+
+        Used to skip re-ingesting content that is already stored,
+        e.g. contains({"source_hash": sha256_of_pdf_bytes})
+
+        Args:
+            filter: Metadata filter (Chroma `where` clause)
+
+        Returns:
+            True if at least one document matches
+        """
+        # include=[] returns ids only — no documents or metadata fetched
+        result = self.store.get(where=filter, limit=1, include=[])
+        return bool(result['ids'])
+
     def delete_collection(self):
         """Delete the entire collection (use with caution!)"""
         self.store.delete_collection()
\ No newline at end of file
@@ -1,21 +1,33 @@
+import copy
+import functools
 import yaml
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+@functools.lru_cache(maxsize=4)
+def _load_yaml_cached(config_path: str, mtime: float) -> dict:
+    # mtime is part of the cache key so an edited file is re-parsed
+    with open(config_path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 def load_config(config_path: str = "config/config.yaml"):
     """
     Load configuration from YAML with optional environment variable overrides.
 
     YAML provides application defaults. Environment variables take precedence.
+    The parsed YAML is cached per (path, mtime); each call gets its own copy
+    with the current environment applied, so callers may mutate it freely.
 
     Optional overrides:
         EMBEDDING_PROVIDER  — override embeddings.provider
         EMBEDDING_MODEL     — override embeddings.model
     """
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    mtime = os.path.getmtime(config_path)
+    config = copy.deepcopy(_load_yaml_cached(config_path, mtime))
 
     if os.getenv('EMBEDDING_PROVIDER'):
         config['embeddings']['provider'] = os.getenv('EMBEDDING_PROVIDER')
@@ -3,10 +3,14 @@ Utility to serialize metadata for ChromaDB compatibility.
 ChromaDB only accepts: str, int, float, bool (NO None values or complex types)
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from datetime import datetime
 import json
 
+# The only value types ChromaDB accepts in metadata
+ChromaDBValue = Union[str, int, float, bool]
+CHROMADB_PRIMITIVES = (str, int, float, bool)
+
 def serialize_for_chromadb(metadata: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert metadata to ChromaDB-compatible format.
@@ -128,7 +132,7 @@ def flatten_metadata(metadata: Dict[str, Any], prefix: str = "") -> Dict[str, An
     return flattened
 
 
-def prepare_chunk_metadata(chunk_metadata) -> Dict[str, Any]:
+def prepare_chunk_metadata(chunk_metadata) -> Dict[str, ChromaDBValue]:
     """
     Prepare ChunkMetadata for ChromaDB storage.
     
@@ -138,7 +142,8 @@ def prepare_chunk_metadata(chunk_metadata) -> Dict[str, Any]:
         chunk_metadata: ChunkMetadata Pydantic model
         
     Returns:
-        ChromaDB-compatible metadata dictionary
+        ChromaDB-compatible metadata dictionary (flat; str/int/float/bool
+        values only, checked unless running under python -O)
     """
     # Convert Pydantic model to dict
     metadata_dict = chunk_metadata.model_dump()
@@ -150,6 +155,14 @@ def prepare_chunk_metadata(chunk_metadata) -> Dict[str, Any]:
     # Option 2: Keep structure but serialize complex types
     # Uncomment below if you prefer nested JSON strings
     # flattened = serialize_for_chromadb(metadata_dict)
+
+    if __debug__:
+        invalid = {
+            k: type(v).__name__
+            for k, v in flattened.items()
+            if not isinstance(v, CHROMADB_PRIMITIVES)
+        }
+        assert not invalid, f"Non-primitive metadata values: {invalid}"
     
     return flattened
 
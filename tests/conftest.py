@@ -1,6 +1,7 @@
 """
 Pytest configuration and shared fixtures
 """
+import os
 import sys
 from pathlib import Path
 import pytest
@@ -14,6 +15,16 @@ from src.loaders.pdf_loader import PDFLoader
 from src.pipeline.ingestion import IngestionPipeline
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skip llm-marked tests when no LLM endpoint is configured"""
+    if os.getenv('OLLAMA_BASE_URL'):
+        return
+    skip_llm = pytest.mark.skip(reason="no LLM endpoint (set OLLAMA_BASE_URL)")
+    for item in items:
+        if "llm" in item.keywords:
+            item.add_marker(skip_llm)
+
+
 @pytest.fixture(scope="session")
 def config():
     """Load configuration once per test session"""
@@ -1,130 +1,45 @@
 """
-Test runner - runs all test suites
+Test runner - runs all test suites in parallel via pytest-xdist
+
+By default runs only tests affected by code changes (pytest-testmon),
+previously failed ones first, and stops at the first failure (fast
+edit-run loop). Set FULL_TESTS=1 to run everything.
+LLM and slow tests are deselected (see pytest.ini); pass --with-llm
+to include them. Other arguments are passed through to pytest.
 """
+import os
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-
-def run_test_suite(test_name, test_functions):
-    """Run a test suite and report results"""
-    print("\n" + "=" * 70)
-    print(f"TEST SUITE: {test_name}")
-    print("=" * 70)
-
-    passed = 0
-    failed = 0
-    errors = []
-
-    for test_func in test_functions:
-        try:
-            test_func()
-            passed += 1
-        except AssertionError as e:
-            failed += 1
-            errors.append((test_func.__name__, str(e)))
-            print(f"\n✗ {test_func.__name__} failed: {e}")
-        except Exception as e:
-            failed += 1
-            errors.append((test_func.__name__, f"Error: {e}"))
-            print(f"\n✗ {test_func.__name__} errored: {e}")
-
-    print("\n" + "-" * 70)
-    print(f"Results: {passed} passed, {failed} failed")
-    print("-" * 70)
-
-    return passed, failed, errors
-
-
-def main():
-    """Run all test suites"""
-    print("\n" + "=" * 70)
-    print("INGESTION PIPELINE - FULL TEST SUITE")
-    print("=" * 70)
-
-    total_passed = 0
-    total_failed = 0
-    all_errors = []
-
-    # Test Suite 1: Metadata Serialization
-    from test_metadata_serialization import (
-        test_metadata_serialization_full,
-        test_metadata_serialization_minimal,
-        test_metadata_serialization_empty_collections
-    )
-
-    passed, failed, errors = run_test_suite(
-        "Metadata Serialization",
-        [
-            test_metadata_serialization_full,
-            test_metadata_serialization_minimal,
-            test_metadata_serialization_empty_collections
-        ]
-    )
-    total_passed += passed
-    total_failed += failed
-    all_errors.extend(errors)
+import pytest
 
-    # Test Suite 2: LLM Extraction
-    from test_llm_extraction import (
-        test_llm_extractor_basic,
-        test_llm_extractor_with_pdf,
-        test_llm_extractor_debug
-    )
+ROOT = Path(__file__).parent.parent
 
-    passed, failed, errors = run_test_suite(
-        "LLM Extraction",
-        [
-            test_llm_extractor_basic,
-            test_llm_extractor_with_pdf,
-            test_llm_extractor_debug
-        ]
-    )
-    total_passed += passed
-    total_failed += failed
-    all_errors.extend(errors)
 
-    # Test Suite 3: Full Pipeline
-    from test_pipeline import (
-        test_pdf_content_inspection,
-        test_full_pipeline,
-        test_pipeline_error_handling
-    )
+def main(argv=None):
+    """Run all test suites, one test file per worker"""
+    argv = sys.argv[1:] if argv is None else argv
 
-    passed, failed, errors = run_test_suite(
-        "Full Pipeline",
-        [
-            test_pdf_content_inspection,
-            test_full_pipeline,
-            test_pipeline_error_handling
-        ]
-    )
-    total_passed += passed
-    total_failed += failed
-    all_errors.extend(errors)
+    # --dist=loadfile keeps each file on a single worker so module-scoped
+    # fixture state is never split across processes
+    args = ["-n", "auto", "--dist=loadfile"]
 
-    # Final Summary
-    print("\n" + "=" * 70)
-    print("FINAL TEST RESULTS")
-    print("=" * 70)
-    print(f"Total Tests: {total_passed + total_failed}")
-    print(f"Passed: {total_passed}")
-    print(f"Failed: {total_failed}")
+    if not os.getenv("FULL_TESTS"):
+        # testmon selects only tests whose imported code changed since the
+        # last run (.testmondata). Plain --testmon turns selection off when
+        # -m is in effect (pytest.ini addopts always sets one), so
+        # --testmon-forceselect combines it with the marker filter instead.
+        # Failures recorded in .pytest_cache run first; -x stops on the first one
+        args += ["--testmon-forceselect", "--ff", "-x"]
 
-    if all_errors:
-        print("\nFailed Tests:")
-        for test_name, error in all_errors:
-            print(f"  - {test_name}: {error}")
+    if "--with-llm" in argv:
+        # Overrides the -m in pytest.ini addopts
+        args += ["-m", "llm or not llm"]
 
-    print("=" * 70)
+    # Anything else goes straight to pytest (e.g. --lf, --co -q, --cache-show)
+    args += [arg for arg in argv if arg != "--with-llm"]
 
-    if total_failed == 0:
-        print("\n✓ ALL TESTS PASSED!")
-        return 0
-    else:
-        print(f"\n✗ {total_failed} TESTS FAILED")
-        return 1
+    return pytest.main(args + [str(ROOT / "tests")])
 
 
 if __name__ == "__main__":
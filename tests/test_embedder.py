@@ -0,0 +1,61 @@
+"""
+Test cases for the Embedder's in-memory embedding cache
+"""
+import asyncio
+
+import pytest
+from src.embeddings.embedder import Embedder
+
+
+class FakeLCEmbeddings:
+    """Stands in for a LangChain embeddings client; records every text sent"""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def embedder():
+    """Ollama-provider Embedder with a fake client (no network)"""
+    embedder = Embedder.__new__(Embedder)
+    embedder.provider = "ollama"
+    embedder._cache = {}
+    embedder._lc_embeddings = FakeLCEmbeddings()
+    return embedder
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test dedupe within and across calls, and result order"""
+
+    TEXTS = ["a", "bbb", "a", "cc", "bbb"]
+    EXPECTED = [[1.0], [3.0], [1.0], [2.0], [3.0]]
+
+    def test_duplicates_embedded_once(self, embedder):
+        """Each distinct text is sent once, and results follow input order"""
+        assert embedder.embed_documents(self.TEXTS) == self.EXPECTED
+        assert embedder._lc_embeddings.calls == [["a", "bbb", "cc"]]
+
+    def test_async_duplicates_embedded_once(self, embedder):
+        """Async path dedupes and scatters results back the same way"""
+        assert asyncio.run(embedder.aembed_documents(self.TEXTS)) == self.EXPECTED
+        assert embedder._lc_embeddings.calls == [["a", "bbb", "cc"]]
+
+    def test_cached_texts_not_resent(self, embedder):
+        """A later call only sends texts not already cached"""
+        embedder.embed_documents(["a", "bbb"])
+        assert embedder.embed_documents(["dddd", "a", "bbb"]) == [[4.0], [1.0], [3.0]]
+        assert embedder._lc_embeddings.calls == [["a", "bbb"], ["dddd"]]
+
+    def test_all_cached_makes_no_call(self, embedder):
+        """No request at all when every text is cached"""
+        embedder.embed_documents(["a"])
+        embedder.embed_documents(["a", "a"])
+        assert embedder._lc_embeddings.calls == [["a"]]
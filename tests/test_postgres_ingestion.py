@@ -0,0 +1,105 @@
+"""
+Test cases for concurrent batch embedding in the Postgres pipeline
+"""
+import asyncio
+
+import pytest
+from src.pipeline.postgres_ingestion import PostgresIngestionPipeline
+
+
+class FakeEmbedder:
+    """Async embedder that returns [index] per text, finishing later batches first"""
+
+    def __init__(self, dim=1):
+        self.dim = dim
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def aembed_documents(self, texts):
+        self.calls.append(texts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Smaller first index sleeps longer, so batches complete out of order
+        await asyncio.sleep(0.01 / (1 + int(texts[0])))
+        self.in_flight -= 1
+        return [[float(t)] * self.dim for t in texts]
+
+
+class FakeLoader:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def load(self, last_run_at):
+        return self.rows
+
+
+class FakeStore:
+    def write_all(self, rows, vectors, batch_size):
+        self.written = list(zip(rows, vectors))
+
+
+def make_pipeline(embedder, concurrency=3, rows=(), batch_size=2):
+    """Pipeline with fake loader/embedder/store (no DB)"""
+    pipeline = PostgresIngestionPipeline.__new__(PostgresIngestionPipeline)
+    pipeline.config = {'postgres': {'table_name': 'test'}, 'embeddings': {}}
+    pipeline.loader = FakeLoader(list(rows))
+    pipeline.embedder = embedder
+    pipeline.store = FakeStore()
+    pipeline.batch_size = batch_size
+    pipeline.concurrency = concurrency
+    return pipeline
+
+
+def make_batches(total, batch_size):
+    texts = [str(i) for i in range(total)]
+    return [texts[i:i + batch_size] for i in range(0, total, batch_size)]
+
+
+@pytest.mark.unit
+class TestEmbedBatches:
+    """Test ordering, concurrency, dedupe and the dimension check"""
+
+    def test_vectors_follow_row_order(self):
+        """Vectors line up with rows even when batches finish out of order"""
+        pipeline = make_pipeline(FakeEmbedder())
+        vectors = asyncio.run(pipeline._embed_batches(make_batches(10, 2), None))
+        assert vectors == [[float(i)] for i in range(10)]
+
+    def test_concurrency_limit(self):
+        """No more than `concurrency` batches are in flight at once"""
+        embedder = FakeEmbedder()
+        pipeline = make_pipeline(embedder, concurrency=2)
+        asyncio.run(pipeline._embed_batches(make_batches(10, 1), None))
+        assert embedder.max_in_flight == 2
+
+    def test_dimension_mismatch_stops_after_first_batch(self):
+        """A wrong dimension raises before the remaining batches are dispatched"""
+        embedder = FakeEmbedder(dim=3)
+        pipeline = make_pipeline(embedder)
+        with pytest.raises(ValueError, match="dimension mismatch"):
+            asyncio.run(pipeline._embed_batches(make_batches(10, 2), 1024))
+        assert embedder.calls == [['0', '1']]
+
+    def test_duplicate_texts_embedded_once(self, monkeypatch):
+        """Rows sharing embedding_text are embedded once and each gets its vector"""
+        monkeypatch.delenv('SSM_LAST_RUN_PARAM', raising=False)
+        rows = [{'service_id': i, 'embedding_text': text}
+                for i, text in enumerate(['3', '1', '3', '2', '1', '3'])]
+        embedder = FakeEmbedder()
+        pipeline = make_pipeline(embedder, rows=rows)
+
+        result = asyncio.run(pipeline.arun())
+
+        embedded = [text for batch in embedder.calls for text in batch]
+        assert embedded == ['3', '1', '2']
+        assert result['total_batches'] == 2
+        assert [(row['service_id'], vector) for row, vector in pipeline.store.written] == [
+            (0, [3.0]), (1, [1.0]), (2, [3.0]), (3, [2.0]), (4, [1.0]), (5, [3.0]),
+        ]
+
+    @pytest.mark.parametrize("value", [0, -1, 2.0, "3", True, None])
+    def test_invalid_concurrency_rejected(self, value):
+        """Concurrency must be an int >= 1 (0 would hang on Semaphore(0))"""
+        with pytest.raises(ValueError, match="concurrency"):
+            PostgresIngestionPipeline._validate_concurrency(value)